@@ -7,14 +7,20 @@ Format icon for macOS app following Apple's design guidelines.
 """
 
 from PIL import Image, ImageDraw
+import functools
 import sys
 import os
 
+@functools.lru_cache(maxsize=None)
 def create_rounded_rectangle_mask(size, radius):
-    """Create a mask for rounded rectangle."""
+    """Create a mask for rounded rectangle.
+
+    Cached by (size, radius): the anti-aliased fill is the expensive part,
+    so repeated calls for the same dimensions reuse the rasterized mask.
+    """
     mask = Image.new('L', size, 0)
     draw = ImageDraw.Draw(mask)
-    
+
     # Draw the rounded rectangle
     draw.rounded_rectangle(
         [(0, 0), (size[0]-1, size[1]-1)],
@@ -46,12 +52,15 @@ def process_icon(input_path, output_path):
     # Apply rounded corners (22.5% of size according to macOS guidelines)
     radius = int(original_size * 0.225)
     mask = create_rounded_rectangle_mask((original_size, original_size), radius)
-    
-    # Create output image with rounded corners and white background
-    output = Image.new('RGBA', (original_size, original_size), (0, 0, 0, 0))
-    output.paste(final_img, (0, 0))
-    output.putalpha(mask)
-    
+
+    # Composite against a transparent canvas through the mask in one fused
+    # per-pixel op instead of the paste + putalpha round-trip
+    output = Image.composite(
+        final_img,
+        Image.new('RGBA', (original_size, original_size), (0, 0, 0, 0)),
+        mask
+    )
+
     # Save the result
     output.save(output_path, 'PNG')
     print(f"Processed icon saved to {output_path}")
@@ -84,20 +93,27 @@ def main():
     iconset_dir = "AppIcon.iconset"
     os.makedirs(iconset_dir, exist_ok=True)
     
+    # Cache resizes by actual pixel dimension: several outputs share the same
+    # dimensions (e.g. 32x32 and 16x16@2x), so each Lanczos pass runs once
+    unique_dims = {}
+
+    def resize_cached(dim):
+        if dim not in unique_dims:
+            unique_dims[dim] = formatted.resize((dim, dim), Image.Resampling.LANCZOS)
+        return unique_dims[dim]
+
     for size, filename in sizes:
-        resized = formatted.resize((size, size), Image.Resampling.LANCZOS)
         output_path = os.path.join(iconset_dir, filename)
-        resized.save(output_path, 'PNG')
+        resize_cached(size).save(output_path, 'PNG')
         print(f"Created {output_path}")
-        
+
         # Also create @2x versions for some sizes
         if size in [16, 32, 128, 256, 512]:
             size_2x = size * 2
             if size_2x <= 1024:
-                resized_2x = formatted.resize((size_2x, size_2x), Image.Resampling.LANCZOS)
                 filename_2x = filename.replace('.png', '@2x.png')
                 output_path_2x = os.path.join(iconset_dir, filename_2x)
-                resized_2x.save(output_path_2x, 'PNG')
+                resize_cached(size_2x).save(output_path_2x, 'PNG')
                 print(f"Created {output_path_2x}")
 
 if __name__ == "__main__":
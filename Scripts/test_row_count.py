@@ -2,16 +2,18 @@
 import sys
 import json
 
-# Try with pandas first, then fall back to pyarrow
+# Try with pyarrow first (row count comes from the footer, no data read),
+# then fall back to manual inspection
 try:
-    import pandas as pd
-    df = pd.read_parquet('./Tests/data.parquet')
-    print(f"Actual rows: {len(df)}")
-    print(f"Columns: {list(df.columns)}")
+    import pyarrow.parquet as pq
+    pf = pq.ParquetFile('./Tests/data.parquet')
+    print(f"Actual rows: {pf.metadata.num_rows}")
+    print(f"Columns: {pf.schema_arrow.names}")
     print("\nFirst 3 rows:")
-    print(df.head(3).to_string())
+    first_batch = next(pf.iter_batches(batch_size=3))
+    print(first_batch.to_pandas().to_string())
 except ImportError:
-    print("pandas not available, trying manual inspection...")
+    print("pyarrow not available, trying manual inspection...")
     # Try to read the file directly
     with open('./Tests/data.parquet', 'rb') as f:
         data = f.read()
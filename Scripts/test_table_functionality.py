@@ -4,127 +4,90 @@ Test script to verify table viewer functionality:
 1. All columns are shown by default
 2. 100 rows are shown by default with pagination
 3. Row count display is correct
+
+Written as standard pytest tests so the cases can run individually and in
+parallel (pytest -n auto); invoking the file directly still works.
 """
 
-import json
+import os
 import sys
+import warnings
+
+import pytest
+
+DEFAULT_ROWS_PER_PAGE = 100
+PAGE_SIZE_OPTIONS = [50, 100, 500, 1000]
+
+TABLE_VIEWER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "Sources", "ParqViewApp", "Views", "TableViewerView.swift"
+)
 
-def test_table_viewer_configuration():
-    """Test that the table viewer has correct default configuration"""
-    
-    print("Testing Table Viewer Configuration...")
-    print("=" * 50)
-    
-    # Test 1: Default rows per page
-    default_rows_per_page = 100
-    print(f"✓ Default rows per page: {default_rows_per_page}")
-    
-    # Test 2: Available page size options
-    page_size_options = [50, 100, 500, 1000]
-    print(f"✓ Page size options: {page_size_options}")
-    assert 100 in page_size_options, "100 should be in page size options"
-    
-    # Test 3: Row count display format
-    test_cases = [
-        # (current_page, rows_per_page, loaded_rows, total_rows, expected_display)
+def format_row_count(current_page, rows_per_page, loaded_rows, total_rows):
+    """Mirror of the row count display formula used by TableViewerView."""
+    if loaded_rows == 0:
+        start = 0
+        end = 0
+    else:
+        start = current_page * rows_per_page + 1
+        end = current_page * rows_per_page + loaded_rows
+    return f"Showing {start}-{end} of {total_rows} rows"
+
+def test_default_configuration():
+    """The table viewer defaults to 100 rows per page with sane options."""
+    assert DEFAULT_ROWS_PER_PAGE == 100
+    assert 100 in PAGE_SIZE_OPTIONS
+
+@pytest.mark.parametrize(
+    "current_page,rows_per_page,loaded_rows,total_rows,expected",
+    [
         (0, 100, 100, 1000, "Showing 1-100 of 1000 rows"),
         (1, 100, 100, 1000, "Showing 101-200 of 1000 rows"),
         (9, 100, 100, 1000, "Showing 901-1000 of 1000 rows"),
         (0, 50, 50, 500, "Showing 1-50 of 500 rows"),
         (4, 100, 50, 450, "Showing 401-450 of 450 rows"),  # Last partial page
         (0, 100, 0, 0, "Showing 0-0 of 0 rows"),  # Empty data
-    ]
-    
-    print("\nTesting row count display:")
-    for current_page, rows_per_page, loaded_rows, total_rows, expected in test_cases:
-        if loaded_rows == 0:
-            # Empty case
-            start = 0
-            end = 0
-        else:
-            start = current_page * rows_per_page + 1
-            end = current_page * rows_per_page + loaded_rows
-        
-        actual = f"Showing {start}-{end} of {total_rows} rows"
-        assert actual == expected, f"Failed: expected '{expected}', got '{actual}'"
-        print(f"  ✓ Page {current_page + 1}: {actual}")
-    
-    # Test 4: Column visibility
-    print("\nTesting column visibility:")
-    mock_columns = ["id", "name", "value", "created_at", "status", "amount", "category"]
-    print(f"  ✓ All {len(mock_columns)} columns should be visible by default")
-    print(f"  ✓ Columns: {', '.join(mock_columns)}")
-    
-    # Test 5: Pagination behavior
-    print("\nTesting pagination behavior:")
+    ],
+)
+def test_row_count_display(current_page, rows_per_page, loaded_rows, total_rows, expected):
+    actual = format_row_count(current_page, rows_per_page, loaded_rows, total_rows)
+    assert actual == expected
+
+def test_pagination_behavior():
+    """Load-more stops exactly when every row has been fetched."""
     total_rows = 1000
     rows_per_page = 100
+
     total_pages = (total_rows + rows_per_page - 1) // rows_per_page
-    print(f"  ✓ Total pages for {total_rows} rows at {rows_per_page} per page: {total_pages}")
-    
-    # Test load more functionality
+    assert total_pages == 10
+
     current_loaded = 100
-    for i in range(3):
+    while current_loaded < total_rows:
         current_loaded += min(rows_per_page, total_rows - current_loaded)
-        print(f"  ✓ After load more #{i+1}: {current_loaded} rows loaded")
-        if current_loaded >= total_rows:
-            print(f"  ✓ All rows loaded, 'Load More' button should be hidden")
-            break
-    
-    print("\n" + "=" * 50)
-    print("All tests passed! ✅")
-    print("\nSummary:")
-    print("1. ✅ All columns are shown by default")
-    print("2. ✅ 100 rows are shown by default with pagination")
-    print("3. ✅ Row count display is correct")
-    
-    return True
+    assert current_loaded == total_rows
 
 def test_swift_code_changes():
-    """Verify the Swift code changes are correct"""
-    
-    print("\n\nVerifying Swift Code Changes...")
-    print("=" * 50)
-    
-    # Check that TableViewerView.swift has been updated
-    swift_file = "/Users/beichenberger/Github/parqview/Sources/ParqViewApp/Views/TableViewerView.swift"
-    
+    """Verify the Swift table viewer matches the expected configuration.
+
+    Informational only: emits warnings rather than failing, since the view
+    implementation moves around between refactors.
+    """
     try:
-        with open(swift_file, 'r') as f:
+        with open(TABLE_VIEWER_PATH, 'r') as f:
             content = f.read()
-            
-        # Check for correct row count display formula
-        if "currentPage * rowsPerPage + 1" in content and "currentPage * rowsPerPage + rows.count" in content:
-            print("✓ Row count display formula has been updated correctly")
-        else:
-            print("⚠️  Row count display formula might need verification")
-        
-        # Check default rows per page
-        if "rowsPerPage = 100" in content:
-            print("✓ Default rows per page is set to 100")
-        else:
-            print("⚠️  Default rows per page might need verification")
-            
-        # Check that all columns are displayed
-        if "file.schema.columns" in content:
-            print("✓ Using all columns from schema")
-        else:
-            print("⚠️  Column display might need verification")
-            
     except FileNotFoundError:
-        print(f"⚠️  Could not find {swift_file}")
-    
-    print("=" * 50)
+        pytest.skip(f"Could not find {TABLE_VIEWER_PATH}")
+
+    checks = [
+        ("row count display formula",
+         "currentPage * rowsPerPage + 1" in content
+         and "currentPage * rowsPerPage + rows.count" in content),
+        ("default rows per page", "rowsPerPage = 100" in content),
+        ("all columns from schema", "file.schema.columns" in content),
+    ]
+    for label, ok in checks:
+        if not ok:
+            warnings.warn(f"{label} might need verification in TableViewerView.swift")
 
 if __name__ == "__main__":
-    try:
-        test_table_viewer_configuration()
-        test_swift_code_changes()
-        print("\n✅ All functionality tests passed!")
-        sys.exit(0)
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        sys.exit(1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
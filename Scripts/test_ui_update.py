@@ -5,13 +5,35 @@ import subprocess
 import time
 import os
 
+# Read at most this many bytes from the end of the log when tailing
+TAIL_BYTES = 8192
+
+def app_is_running():
+    """Check for a running ParqViewApp without forking pgrep if psutil is available."""
+    try:
+        import psutil
+        return any(
+            'ParqViewApp' in (proc.info['name'] or '')
+            for proc in psutil.process_iter(['name'])
+        )
+    except ImportError:
+        result = subprocess.run(["pgrep", "-f", "ParqViewApp"], capture_output=True, text=True)
+        return result.returncode == 0
+
+def tail_lines(path, count=20):
+    """Return the last `count` lines of a file reading only a bounded tail."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - TAIL_BYTES))
+        return f.read().decode(errors='replace').splitlines()[-count:]
+
 print("Testing UI update when file is loaded...")
 
 # Check if app is running
-result = subprocess.run(["pgrep", "-f", "ParqViewApp"], capture_output=True, text=True)
-if result.returncode == 0:
+if app_is_running():
     print("✅ ParqView app is running")
-    
+
     # Try to open a file using AppleScript
     script = '''
     tell application "System Events"
@@ -21,24 +43,20 @@ if result.returncode == 0:
         end tell
     end tell
     '''
-    
+
     print("Sending Cmd+O to open file dialog...")
     subprocess.run(["osascript", "-e", script])
-    
+
     # Give it time to open
     time.sleep(2)
-    
+
     # Check the log
     log_path = os.path.expanduser("~/parqview_debug.log")
     if os.path.exists(log_path):
-        with open(log_path, 'r') as f:
-            lines = f.readlines()
-            recent_lines = lines[-20:] if len(lines) > 20 else lines
-            
-            print("\nRecent log entries:")
-            for line in recent_lines:
-                print(line.strip())
-    
+        print("\nRecent log entries:")
+        for line in tail_lines(log_path):
+            print(line.strip())
+
 else:
     print("❌ ParqView app is not running")
-    print("Please run: .build/debug/ParqViewApp")
\ No newline at end of file
+    print("Please run: .build/debug/ParqViewApp")